@@ -189,6 +189,13 @@ def _num(val, default=0.0):
     except Exception:
         return float(default)
 
+def _rc_to_cube(r: int, c: int):
+    """Odd-r offset (row, col) -> cube coordinates."""
+    x = c - ((r & 1) / 2.0)
+    z = r
+    y = -x - z
+    return (x, y, z)
+
 def _ensure_combat_numbers(u: Unit):
     """Ensure Unit has coherent range/projectile_speed/dps numerics.
     - Treat range>1 as ranged even if projectile_speed is missing/0
@@ -278,6 +285,21 @@ class BattleEngine:
     units: list
     projectiles: list = field(default_factory=list)
 
+    def __post_init__(self):
+        # Per-owner count of living units. step() keeps it current as units
+        # die, so alive_counts() does not rescan every unit each sub-tick.
+        self.alive_count = [0, 0]
+        for owner, u in self.units:
+            if u.is_alive():
+                self.alive_count[owner] += 1
+
+    def _damage(self, owner: int, u, dmg: float):
+        """Apply dmg to unit u (owned by owner), updating alive_count on a kill."""
+        was_alive = u.is_alive()
+        u.hp -= dmg
+        if was_alive and not u.is_alive():
+            self.alive_count[owner] -= 1
+
     # ---- numeric coercion helper ----
     @staticmethod
     def _num(val, default=0.0):
@@ -297,27 +319,18 @@ class BattleEngine:
         Hex-grid nearest enemy using odd-r offset coordinates.
         We compute cube distance for tie-breaking stability.
         """
-        def rc_to_cube(r: int, c: int):
-            # odd-r offset to cube
-            x = c - ((r & 1) / 2.0)
-            z = r
-            y = -x - z
-            return (x, y, z)
-
-        def hex_dist(r1: int, c1: int, r2: int, c2: int) -> int:
-            x1, y1, z1 = rc_to_cube(r1, c1)
-            x2, y2, z2 = rc_to_cube(r2, c2)
-            return int((abs(x1 - x2) + abs(y1 - y2) + abs(z1 - z2)) / 2)
-
         owner_i, ui = self.units[idx]
         best = None
         best_key = None
         ur, uc = round(ui.pos[0]), round(ui.pos[1])
+        # this unit's cube coords are loop-invariant; convert them once
+        x1, y1, z1 = _rc_to_cube(ur, uc)
         for j, (owner_j, uj) in enumerate(self.units):
             if owner_j == owner_i or not uj.is_alive():
                 continue
             tr, tc = round(uj.pos[0]), round(uj.pos[1])
-            d = hex_dist(ur, uc, tr, tc)
+            x2, y2, z2 = _rc_to_cube(tr, tc)
+            d = int((abs(x1 - x2) + abs(y1 - y2) + abs(z1 - z2)) / 2)
             # deterministic tie-breaker
             key = (d, tc, tr, j)
             if best is None or key < best_key:
@@ -339,7 +352,7 @@ class BattleEngine:
             p.remaining -= dt
             if p.remaining <= 0:
                 if 0 <= p.target_idx < len(self.units) and alive_mask[p.target_idx]:
-                    self.units[p.target_idx][1].hp -= p.dmg
+                    self._damage(*self.units[p.target_idx], p.dmg)
             else:
                 tmp.append(p)
         self.projectiles = tmp
@@ -635,7 +648,7 @@ class BattleEngine:
                     )
                 else:
                     # melee: apply damage immediately
-                    tj.hp -= dmg_val
+                    self._damage(self.units[t_idx][0], tj, dmg_val)
 
                 # Attack cooldown from catalog hit_speed (already seconds per hit)
                 ui.cooldown = hit_interval
@@ -647,15 +660,14 @@ class BattleEngine:
             p.remaining -= dt
             if p.remaining <= 0:
                 if 0 <= p.target_idx < len(self.units) and alive_mask[p.target_idx]:
-                    self.units[p.target_idx][1].hp -= p.dmg
+                    self._damage(*self.units[p.target_idx], p.dmg)
             else:
                 tmp.append(p)
         self.projectiles = tmp
         # dead units persist; do not remove them
 
     def alive_counts(self):
-        p0 = sum(1 for o,u in self.units if o==0 and u.is_alive())
-        p1 = sum(1 for o,u in self.units if o==1 and u.is_alive())
+        p0, p1 = self.alive_count
         return p0, p1
 
 class MTEnv:
@@ -27,6 +27,12 @@ HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+
+# Hard cap on bytes read per page; guards against pathological responses.
+MAX_BYTES = 4_000_000
+
 # Map many possible wiki labels -> our canonical keys
 LABEL_MAP = {
     # costs / economy
@@ -84,9 +90,12 @@ def parse_num(raw: str):
     return val
 
 def fetch(url: str) -> BeautifulSoup:
-    r = requests.get(url, headers=HEADERS, timeout=30)
-    r.raise_for_status()
-    return BeautifulSoup(r.text, "html.parser")
+    # Stream the body and hand raw bytes to lxml, which decodes using the
+    # page's declared charset; avoids materializing a decoded str copy.
+    with SESSION.get(url, timeout=30, stream=True) as r:
+        r.raise_for_status()
+        body = r.raw.read(MAX_BYTES, decode_content=True)
+    return BeautifulSoup(body, "lxml")
 
 def is_unit_link(href: str) -> bool:
     # We want pages ending with /Merge_Tactics (e.g., /Archers/Merge_Tactics)
@@ -124,7 +133,10 @@ def parse_infobox(soup: BeautifulSoup) -> dict:
         b = li.find("b")
         if b:
             key = norm_space(b.get_text(" "))
-            val = norm_space(li.get_text(" ").replace(key, "", 1))
+            # the value is the li's text outside the label; skip the label's
+            # strings rather than detaching it, so the shared soup stays intact
+            val = norm_space(" ".join(
+                s for s in li.strings if all(p is not b for p in s.parents)))
             assign_kv(data, key, val)
 
     return data
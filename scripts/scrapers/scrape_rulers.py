@@ -48,7 +48,7 @@ def norm_space(s: str) -> str:
 def fetch(url: str) -> BeautifulSoup:
     r = requests.get(url, headers=HEADERS, timeout=30)
     r.raise_for_status()
-    return BeautifulSoup(r.text, "html.parser")
+    return BeautifulSoup(r.text, "lxml")
 
 def makedirs_safe(path: str):
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
@@ -14,12 +14,26 @@ Zero-config usage:
     python -m scripts.scrapers.scrape_traits
 """
 from __future__ import annotations
-import json, os, re, sys, time
+import json, os, re, sys, threading, time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    from requests_cache import CachedSession
+except ImportError:  # optional: without it every run goes to the network
+    CachedSession = None
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json writer
+    orjson = None
 
 BASE = "https://clashroyale.fandom.com"
 CATEGORY_ROOT = "https://clashroyale.fandom.com/wiki/Category:Cards_by_Trait"
@@ -27,40 +41,181 @@ CATEGORY_ROOT = "https://clashroyale.fandom.com/wiki/Category:Cards_by_Trait"
 HEADERS = {
     "User-Agent": "merge-tactics-traits-scraper/1.1 (+https://github.com/yourname)",
     "Accept-Language": "en-US,en;q=0.9",
+    # compressed bodies; urllib3 adds br/zstd only when it can decode them
+    "Accept-Encoding": ACCEPT_ENCODING,
 }
 
 OUT_TRAITS = "data/traits_index.json"
 OUT_CARDMAP = "data/card_to_traits.json"
-SLEEP = 0.4  # polite delay between requests (sec)
+MAX_RPS = 5       # polite request rate toward the wiki (requests/sec)
+MAX_WORKERS = 16  # trait groups processed concurrently
+CACHE_PATH = "data/.trait_cache"  # sqlite response cache (requests-cache)
+CACHE_TTL = 60 * 60 * 24          # seconds
+
+def _make_session() -> requests.Session:
+    if CachedSession is not None:
+        os.makedirs(os.path.dirname(CACHE_PATH) or ".", exist_ok=True)
+        # cache_control: honor the wiki's Cache-Control headers, and revalidate
+        # expired entries with If-None-Match / If-Modified-Since so unchanged
+        # pages come back as an empty 304 and are served from the cache.
+        session = CachedSession(CACHE_PATH, backend="sqlite", cache_control=True,
+                                expire_after=CACHE_TTL, allowable_codes=(200,))
+    else:
+        session = requests.Session()
+    session.headers.update(HEADERS)
+    session.mount("https://", HTTPAdapter(
+        pool_connections=MAX_WORKERS,
+        pool_maxsize=MAX_WORKERS,  # one pooled connection per worker thread
+        pool_block=True,  # wait for a pooled connection rather than open throwaway ones
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504]),
+    ))
+    return session
+
+# One keep-alive session for the whole run: connections (and TLS handshakes)
+# are reused across every fetch instead of being re-established per request.
+# With requests-cache installed, repeated GETs (within a run or across
+# reruns) are answered from the on-disk cache. Built on first use, so merely
+# importing this module does not create the cache file.
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+def get_session() -> requests.Session:
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = _make_session()
+    return _SESSION
+
+class _RateLimiter:
+    """Thread-safe token bucket: allows bursts of up to `rate` requests,
+    then refills at `rate` tokens per second."""
+
+    def __init__(self, rate: float):
+        self.rate = float(rate)
+        self.tokens = float(rate)
+        self.stamp = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.stamp) * self.rate)
+                self.stamp = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) / self.rate
+            time.sleep(wait)
+
+# Shared by every worker thread, so the whole run stays under MAX_RPS.
+LIMITER = _RateLimiter(MAX_RPS)
+
+WS_RE = re.compile(r"\s+")
+TRAIT_PREFIX_RES = (  # stripped in this order
+    re.compile(r"(?i)^trait:\s*"),
+    re.compile(r"(?i)^cards by trait:\s*"),
+    re.compile(r"(?i)^category:\s*"),
+)
+BOILERPLATE_RE = re.compile(r"^\s*(This page|The following)\b", re.I)
+TRAIT_LABEL_RE = re.compile(r"(?i)trait:\s*\w+")
+TRAIT_LINK_SEL = 'a[href*="/wiki/Trait:"]:not([href*="Category:"])'
+WIKI_LINK_SEL = 'a[href*="/wiki/"]:not([href*="Category:"])'
+HEX6_RE = re.compile(r"#([0-9a-fA-F]{6})")
+HEX3_RE = re.compile(r"#([0-9a-fA-F]{3})")
+RGBA_RE = re.compile(r"rgba?\(([^)]+)\)")
+STYLE_COLOR_PROPS = ("background-color", "color", "border-color")  # checked in order
+DATA_COLOR_ATTRS = ("data-color", "data-colour", "data-bgcolor", "data-background")
+
+class _AnyStrainer(SoupStrainer):
+    """Keeps a tag if any of `strainers` would (a single SoupStrainer ANDs its rules)."""
+
+    def __init__(self, *strainers: SoupStrainer):
+        super().__init__()
+        self.strainers = strainers
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return any(s.allow_tag_creation(nsprefix, name, attrs) for s in self.strainers)
+
+# Linked 'Trait: X' pages are only read for their article body (first paragraph
+# and inline colors) plus the page subtitle that _first_meaningful_paragraph
+# falls back to, so parse just those and skip nav/sidebars/footer.
+CONTENT_STRAINER = _AnyStrainer(
+    SoupStrainer(id="mw-content-text"),
+    SoupStrainer(class_=["page-header__subtitle", "mw-page-title-namespace"]),
+)
 
 # ------------------------
 # utils
 # ------------------------
 def norm_space(s: str) -> str:
-    return re.sub(r"\s+", " ", s or "").strip()
+    return WS_RE.sub(" ", s or "").strip()
+
+def _get(url: str) -> requests.Response:
+    session = get_session()
+    if CachedSession is not None and isinstance(session, CachedSession):
+        # fresh cache hits send nothing to the wiki, so they skip the rate
+        # limiter; misses and expired entries (revalidated upstream) get a
+        # 504 here and take a token below like any other request
+        r = session.get(url, timeout=30, only_if_cached=True)
+        if r.status_code != 504:
+            return r
+    LIMITER.acquire()
+    return session.get(url, timeout=30)
 
-def fetch(url: str) -> BeautifulSoup:
-    r = requests.get(url, headers=HEADERS, timeout=30)
+def fetch(url: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    r = _get(url)
     r.raise_for_status()
-    return BeautifulSoup(r.text, "html.parser")
+    # hand lxml the raw bytes: it sniffs the charset itself, skipping the
+    # requests-side decode (and its chardet fallback) that r.text implies
+    return BeautifulSoup(r.content, "lxml", parse_only=parse_only)
+
+def _abs(href: str) -> str:
+    """Absolute URL for a wiki href; root-relative '/wiki/...' links (nearly
+    all of them) are concatenated instead of going through urljoin."""
+    if href.startswith("/") and not href.startswith("//"):
+        return BASE + href
+    return urljoin(BASE, href)
 
 def makedirs_safe(path: str):
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
 
+def write_json(path: str, obj) -> None:
+    """Write obj as indented UTF-8 JSON (orjson when available)."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False, indent=2)
+
 # ------------------------
 # crawl helpers
 # ------------------------
-def collect_trait_category_pages(root_url: str) -> List[str]:
-    """Follow pagination of the root category."""
-    pages, seen = [], set()
+# Simple tag/attribute lookups go through bs4's native find/find_all, which
+# skips the soupsieve CSS engine that .select() routes through.
+def _member_links(soup: BeautifulSoup):
+    return soup.find_all("a", class_="category-page__member-link", href=True)
+
+def _next_page_link(soup: BeautifulSoup):
+    return (soup.find("a", rel="next")
+            or soup.find("a", class_="category-page__pagination-next"))
+
+def _iter_category_pages(root_url: str):
+    """Yield (url, soup) for each page of a paginated category."""
+    seen = set()
     url = root_url
     while url and url not in seen:
         seen.add(url)
-        pages.append(url)
         soup = fetch(url)
-        nxt = soup.select_one("a[rel='next'], a.category-page__pagination-next")
-        url = urljoin(BASE, nxt["href"]) if nxt and nxt.get("href") else None
-    return pages
+        yield url, soup
+        nxt = _next_page_link(soup)
+        url = _abs(nxt["href"]) if nxt and nxt.get("href") else None
+
+def collect_trait_category_pages(root_url: str) -> List[str]:
+    """Follow pagination of the root category."""
+    return [url for url, _soup in _iter_category_pages(root_url)]
 
 def collect_trait_subcategories(root_url: str) -> List[Tuple[str,str]]:
     """
@@ -68,15 +223,14 @@ def collect_trait_subcategories(root_url: str) -> List[Tuple[str,str]]:
     /wiki/Category:Trait:_Ace or similar.
     """
     trait_pages: List[Tuple[str,str]] = []
-    for page in collect_trait_category_pages(root_url):
-        soup = fetch(page)
-        for a in soup.select("a.category-page__member-link[href]"):
+    # reuse the soup fetched while paginating instead of fetching each page again
+    for _page, soup in _iter_category_pages(root_url):
+        for a in _member_links(soup):
             href = a["href"]
             title = norm_space(a.get_text(" "))
             # only subcategories (traits), skip direct pages
             if "/wiki/Category:" in href:
-                trait_pages.append((title, urljoin(BASE, href)))
-        time.sleep(SLEEP)
+                trait_pages.append((title, _abs(href)))
     # de-dup by URL
     seen, out = set(), []
     for name, url in trait_pages:
@@ -87,9 +241,8 @@ def collect_trait_subcategories(root_url: str) -> List[Tuple[str,str]]:
 
 def normalize_trait_name(name: str) -> str:
     n = norm_space(name)
-    n = re.sub(r"(?i)^trait:\s*", "", n)
-    n = re.sub(r"(?i)^cards by trait:\s*", "", n)
-    n = re.sub(r"(?i)^category:\s*", "", n)
+    for pat in TRAIT_PREFIX_RES:
+        n = pat.sub("", n)
     return n.strip().title()
 
 def extract_cards_from_trait_category(trait_cat_url: str, first_soup: Optional[BeautifulSoup] = None) -> List[Tuple[str,str]]:
@@ -101,16 +254,15 @@ def extract_cards_from_trait_category(trait_cat_url: str, first_soup: Optional[B
         seen.add(url)
         if soup is None:
             soup = fetch(url)
-        for a in soup.select("a.category-page__member-link[href]"):
+        for a in _member_links(soup):
             href = a["href"]
             if "/wiki/Category:" in href:
                 continue  # nested subcategory; ignore
             name = norm_space(a.get_text(" "))
-            cards.append((name, urljoin(BASE, href)))
-        nxt = soup.select_one("a[rel='next'], a.category-page__pagination-next")
-        url = urljoin(BASE, nxt["href"]) if nxt and nxt.get("href") else None
+            cards.append((name, _abs(href)))
+        nxt = _next_page_link(soup)
+        url = _abs(nxt["href"]) if nxt and nxt.get("href") else None
         soup = None
-        time.sleep(SLEEP)
     # de-dup by URL
     out, seen2 = [], set()
     for n,u in cards:
@@ -122,12 +274,12 @@ def extract_cards_from_trait_category(trait_cat_url: str, first_soup: Optional[B
 # trait description extraction
 # ------------------------
 def _first_meaningful_paragraph(soup: BeautifulSoup) -> str | None:
-    content = soup.select_one("#mw-content-text")
+    content = soup.find(id="mw-content-text")
     if not content:
         return None
-    for p in content.select("p"):
+    for p in content.find_all("p"):
         txt = norm_space(p.get_text(" "))
-        if txt and not re.match(r"^\s*(This page|The following)\b", txt, re.I):
+        if txt and not BOILERPLATE_RE.match(txt):
             return txt
     # fallback to description box if any
     sub = soup.select_one(".page-header__subtitle, .mw-page-title-namespace")
@@ -142,27 +294,26 @@ def _maybe_follow_trait_page_from_category(soup_cat: BeautifulSoup) -> str | Non
     Some categories link to a canonical 'Trait: X' content page.
     Try to find a link that looks like a non-category 'Trait:' page.
     """
-    for a in soup_cat.select("a[href]"):
-        href = a.get("href") or ""
-        label = norm_space(a.get_text(" "))
-        if re.search(r"/wiki/Trait:", href) and "Category:" not in href:
-            return urljoin(BASE, href)
-        # sometimes the label itself is 'Trait: X'
-        if re.match(r"(?i)trait:\s*\w+", label) and "/wiki/" in href and "Category:" not in href:
-            return urljoin(BASE, href)
+    a = soup_cat.select_one(TRAIT_LINK_SEL)
+    if a:
+        return _abs(a["href"])
+    # sometimes only the label says 'Trait: X'
+    for a in soup_cat.select(WIKI_LINK_SEL):
+        if TRAIT_LABEL_RE.match(norm_space(a.get_text(" "))):
+            return _abs(a["href"])
     return None
 
 def _css_color_to_hex(val: str) -> Optional[str]:
     if not val:
         return None
-    m = re.search(r"#([0-9a-fA-F]{6})", val)
+    m = HEX6_RE.search(val)
     if m:
         return f"#{m.group(1).upper()}"
-    m = re.search(r"#([0-9a-fA-F]{3})", val)
+    m = HEX3_RE.search(val)
     if m:
         c = m.group(1).upper()
         return f"#{c[0]*2}{c[1]*2}{c[2]*2}"
-    m = re.search(r"rgba?\(([^)]+)\)", val)
+    m = RGBA_RE.search(val)
     if m:
         parts = [p.strip() for p in m.group(1).split(",")]
         if len(parts) >= 3:
@@ -176,25 +327,67 @@ def _css_color_to_hex(val: str) -> Optional[str]:
                 return None
     return None
 
+def _style_decls(style: str) -> Dict[str, str]:
+    """Split an inline style attribute into {property: value} in one pass."""
+    decls: Dict[str, str] = {}
+    for part in style.split(";"):
+        key, sep, val = part.partition(":")
+        if sep:
+            decls.setdefault(key.strip().lower(), val.strip())
+    return decls
+
 def _extract_trait_color_from_soup(soup: BeautifulSoup) -> Optional[str]:
-    for el in soup.select("[style]"):
-        style = el.get("style") or ""
-        for prop in ("background-color", "color", "border-color"):
-            m = re.search(rf"{prop}\s*:\s*([^;]+)", style, re.I)
-            if not m:
-                continue
-            hexcol = _css_color_to_hex(m.group(1))
-            if hexcol:
-                return hexcol
-    # Try looking for css variables stored in data attributes
-    for attr in ("data-color", "data-colour", "data-bgcolor", "data-background"):
-        for el in soup.select(f"[{attr}]"):
-            hexcol = _css_color_to_hex(el.get(attr, ""))
-            if hexcol:
-                return hexcol
+    """First usable color in document order, from an inline style or one of
+    the data-* color attributes; a single walk that stops at the first hit."""
+    for el in soup.descendants:
+        attrs = getattr(el, "attrs", None)
+        if not attrs:
+            continue
+        style = attrs.get("style")
+        if style:
+            decls = _style_decls(style)
+            for prop in STYLE_COLOR_PROPS:
+                if prop not in decls:
+                    continue
+                hexcol = _css_color_to_hex(decls[prop])
+                if hexcol:
+                    return hexcol
+        # css colors stored in data attributes
+        for attr in DATA_COLOR_ATTRS:
+            val = attrs.get(attr)
+            if val:
+                hexcol = _css_color_to_hex(val)
+                if hexcol:
+                    return hexcol
     return None
 
-def extract_trait_description(trait_url: str, soup_cat: Optional[BeautifulSoup] = None) -> str:
+_NOT_FETCHED = object()
+
+class _LinkedTraitPage:
+    """The 'Trait: X' page a category links to (content only), fetched lazily.
+
+    `get()` fetches at most once, and only when a caller actually falls back
+    to the linked page. A missing link or failed fetch is remembered as None,
+    so it is not retried; the sentinel marks "not fetched yet".
+    """
+
+    def __init__(self, soup_cat: BeautifulSoup):
+        self.soup_cat = soup_cat
+        self._soup = _NOT_FETCHED
+
+    def get(self) -> Optional[BeautifulSoup]:
+        if self._soup is _NOT_FETCHED:
+            self._soup = None
+            linked = _maybe_follow_trait_page_from_category(self.soup_cat)
+            if linked:
+                try:
+                    self._soup = fetch(linked, parse_only=CONTENT_STRAINER)
+                except Exception:
+                    pass
+        return self._soup
+
+def extract_trait_description(trait_url: str, soup_cat: Optional[BeautifulSoup] = None,
+                              linked: Optional[_LinkedTraitPage] = None) -> str:
     """
     Best-effort: try the trait category page; if that fails, follow to a 'Trait: X' page;
     return first meaningful paragraph.
@@ -206,37 +399,49 @@ def extract_trait_description(trait_url: str, soup_cat: Optional[BeautifulSoup]
         return text
 
     # 2) follow to dedicated trait page if linked
-    linked = _maybe_follow_trait_page_from_category(soup_cat)
-    if linked:
-        soup_trait = fetch(linked)
+    soup_trait = (linked or _LinkedTraitPage(soup_cat)).get()
+    if soup_trait is not None:
         text2 = _first_meaningful_paragraph(soup_trait)
         if text2:
             return text2
 
     # 3) fallback: page subtitle or title
-    head = soup_cat.select_one("#firstHeading")
+    head = soup_cat.find(id="firstHeading")
     heading = norm_space(head.get_text(" ")) if head else ""
     return f"{heading} (no description found)"
 
-def extract_trait_color(trait_url: str, soup_cat: Optional[BeautifulSoup] = None) -> Optional[str]:
+def extract_trait_color(trait_url: str, soup_cat: Optional[BeautifulSoup] = None,
+                        linked: Optional[_LinkedTraitPage] = None) -> Optional[str]:
     soup_cat = soup_cat or fetch(trait_url)
     color = _extract_trait_color_from_soup(soup_cat)
     if color:
         return color
-    linked = _maybe_follow_trait_page_from_category(soup_cat)
-    if linked:
-        try:
-            soup_trait = fetch(linked)
-            color = _extract_trait_color_from_soup(soup_trait)
-            if color:
-                return color
-        except Exception:
-            pass
+    soup_trait = (linked or _LinkedTraitPage(soup_cat)).get()
+    if soup_trait is not None:
+        return _extract_trait_color_from_soup(soup_trait)
     return None
 
 # ------------------------
 # main
 # ------------------------
+def process_trait(raw_trait: str, url: str) -> Tuple[str, Dict, List[Tuple[str,str]]]:
+    """Fetch one trait category and return (trait, index_entry, cards)."""
+    trait = normalize_trait_name(raw_trait)
+    soup_cat = fetch(url)
+    # the linked 'Trait: X' page is shared by both, so it is fetched at most
+    # once, and only if the category page alone is not enough
+    linked = _LinkedTraitPage(soup_cat)
+    desc = extract_trait_description(url, soup_cat=soup_cat, linked=linked)
+    color = extract_trait_color(url, soup_cat=soup_cat, linked=linked)
+    cards = extract_cards_from_trait_category(url, first_soup=soup_cat)
+    entry = {
+        "description": desc,
+        "cards": [{"name": n, "url": u} for (n, u) in cards],
+    }
+    if color:
+        entry["color"] = color
+    return trait, entry, cards
+
 def main():
     print("Scanning Cards by Trait…", file=sys.stderr)
     subcats = collect_trait_subcategories(CATEGORY_ROOT)
@@ -245,34 +450,36 @@ def main():
     traits_index: Dict[str, Dict] = {}
     card_to_traits: Dict[str, set] = {}
 
-    for i, (raw_trait, url) in enumerate(subcats, 1):
-        trait = normalize_trait_name(raw_trait)
-        try:
-            soup_cat = fetch(url)
-            desc = extract_trait_description(url, soup_cat=soup_cat)
-            color = extract_trait_color(url, soup_cat=soup_cat)
-            cards = extract_cards_from_trait_category(url, first_soup=soup_cat)
-            entry = {
-                "description": desc,
-                "cards": [{"name": n, "url": u} for (n, u) in cards],
-            }
-            if color:
-                entry["color"] = color
-            traits_index[trait] = entry
-            for (n, _u) in cards:
-                card_to_traits.setdefault(n, set()).add(trait)
-            print(f"[{i}/{len(subcats)}] {trait}: {len(cards)} cards", file=sys.stderr)
-        except Exception as e:
-            print(f"[WARN] trait={trait} url={url} :: {e}", file=sys.stderr)
-        time.sleep(SLEEP)
+    # Trait pages are independent and the work is network-bound, so fan them
+    # out over a thread pool and report each one as soon as it finishes.
+    # Results are merged here in subcategory order so the output is stable.
+    results: List[Optional[Tuple[str, Dict, List[Tuple[str,str]]]]] = [None] * len(subcats)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = {pool.submit(process_trait, raw, url): i for i, (raw, url) in enumerate(subcats)}
+        for done, fut in enumerate(as_completed(futures), 1):
+            i = futures[fut]
+            raw_trait, url = subcats[i]
+            try:
+                results[i] = fut.result()
+            except Exception as e:
+                print(f"[WARN] trait={normalize_trait_name(raw_trait)} url={url} :: {e}", file=sys.stderr)
+                continue
+            trait, _entry, cards = results[i]
+            print(f"[{done}/{len(subcats)}] {trait}: {len(cards)} cards", file=sys.stderr)
+
+    for res in results:
+        if res is None:
+            continue
+        trait, entry, cards = res
+        traits_index[trait] = entry
+        for (n, _u) in cards:
+            card_to_traits.setdefault(n, set()).add(trait)
 
     # finalize & write
-    card_to_traits_json = {k: sorted(list(v)) for k, v in card_to_traits.items()}
+    card_to_traits_json = {k: sorted(v) for k, v in card_to_traits.items()}
     makedirs_safe(OUT_TRAITS)
-    with open(OUT_TRAITS, "w", encoding="utf-8") as f:
-        json.dump(traits_index, f, ensure_ascii=False, indent=2)
-    with open(OUT_CARDMAP, "w", encoding="utf-8") as f:
-        json.dump(card_to_traits_json, f, ensure_ascii=False, indent=2)
+    write_json(OUT_TRAITS, traits_index)
+    write_json(OUT_CARDMAP, card_to_traits_json)
 
     print(f"Wrote traits_index -> {OUT_TRAITS}")
     print(f"Wrote card_to_traits -> {OUT_CARDMAP}")
@@ -1,4 +1,5 @@
 import os, sys, time, math, re
+from collections import OrderedDict
 import pygame
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
@@ -66,6 +67,11 @@ HEX_VSTEP = 1.5 * HEX_R                    # vertical distance between row cente
 def hex_center(rc):
     """Return pixel center (x,y) for grid coords (r,c) using odd-r offset."""
     r, c = rc
+    if r.__class__ is int and c.__class__ is int and 0 <= r < BOARD_H and 0 <= c < BOARD_W:
+        return HEX_CENTERS[r][c]
+    return _hex_center_calc(r, c)
+
+def _hex_center_calc(r, c):
     bx, by = board_origin()
     # offset x by half a hex width for odd rows
     x = bx + HEX_W * (c + 0.5 * (r & 1))
@@ -73,26 +79,40 @@ def hex_center(rc):
     # small margins so top-left hex is fully visible
     return int(x + HEX_W * 0.75), int(y + HEX_R * 1.1)
 
+# unit vectors to the 6 vertices of a pointy-top hex, computed once
+HEX_UNIT = tuple(
+    (math.cos(math.radians(60 * k - 30)), math.sin(math.radians(60 * k - 30)))
+    for k in range(6)
+)
+
 def hex_points(cx, cy, r=HEX_R):
     """6 vertices of a pointy-top hex centered at (cx,cy)."""
-    pts = []
-    for k in range(6):
-        theta = math.radians(60 * k - 30)  # pointy-top
-        pts.append((cx + r * math.cos(theta), cy + r * math.sin(theta)))
-    return pts
+    return [(cx + r * ux, cy + r * uy) for ux, uy in HEX_UNIT]
 
 # Safe defaults if rules module lacks these
 SUB_TICK_DT = getattr(rules, "SUB_TICK_DT", 0.1)
 MAX_BATTLE_TIME = getattr(rules, "MAX_BATTLE_TIME", 30.0)
 ABSOLUTE_BATTLE_TIME_CAP = getattr(rules, "ABSOLUTE_BATTLE_TIME_CAP", 300.0)
 END_ONLY_ON_WIPE = getattr(rules, "END_ONLY_ON_WIPE", False)
+KING_HP_MAX = getattr(rules, 'KING_HP_MAX', 10)
 
 # Runtime speed controls
 SPEED_MULT = 1.0
 DEPLOY_DELAY_MS_DEFAULT = 250
 BATTLE_BASE_SPEED = 3.0        # additional substeps per frame for faster battles
+BATTLE_FPS = 60                # nominal battle frame rate the speeds are tuned for
+MAX_FRAME_MS = 100.0           # wall time credited per frame at most (no catch-up bursts)
+FOOTER_REFRESH_FRAMES = 6      # battle footer status re-rendered every N frames (~10 Hz)
 PROJECTILE_SPEED_SCALE = 0.75  # viewer-only projectile slow-down (1.0 = stock)
 
+# Hotkey tables: battle speed multipliers on 1..5, deploy delay steps on -/+
+SPEED_KEYS = {pygame.K_1: 1.0, pygame.K_2: 2.0, pygame.K_3: 4.0, pygame.K_4: 8.0, pygame.K_5: 16.0}
+DELAY_KEYS = {pygame.K_MINUS: 50, pygame.K_EQUALS: -50, pygame.K_PLUS: -50}
+# the only event types the viewer loops react to
+HANDLED_EVENTS = (pygame.QUIT, pygame.KEYDOWN)
+
+EMPTY = ()  # shared default for missing shop/bench sequences
+
 ARCHER = getattr(rules, 'ARCHER', 1)
 TANK = getattr(rules, 'TANK', 0)
 
@@ -105,6 +125,15 @@ def board_origin():
     by = TOP_H
     return bx, by
 
+BOARD_X, BOARD_Y = board_origin()
+# small margins so the top-left hex is fully visible (see hex_center)
+PX_X_MARGIN = HEX_W * 0.75
+PX_Y_MARGIN = HEX_R * 1.1
+
+# Pixel centers of every board cell; the board origin is fixed, so this is
+# built once and hex_center() becomes a table lookup for integer cells.
+HEX_CENTERS = [[_hex_center_calc(r, c) for c in range(BOARD_W)] for r in range(BOARD_H)]
+
 def cell_rect(r, c):
     # bounding box around the hex (used rarely)
     cx, cy = hex_center((r, c))
@@ -115,29 +144,79 @@ def pos_to_px(rf, cf):
     We linearly interpolate the half‑column offset between neighbouring rows
     so moving across rows doesn’t cause jumps (the classic odd‑r discontinuity).
     """
-    bx, by = board_origin()
+    # units resting on a cell centre (the common case) hit the HEX_CENTERS
+    # table, which holds exactly what the blend below yields for alpha == 0
+    ri = int(rf); ci = int(cf)
+    if ri == rf and ci == cf and 0 <= ri < BOARD_H and 0 <= ci < BOARD_W:
+        return HEX_CENTERS[ri][ci]
     r = float(rf); c = float(cf)
     r0 = math.floor(r)
-    r1 = r0 + 1
     alpha = r - r0  # blend toward next row
-    # odd‑r offset (0 for even rows, 0.5 for odd rows), blended across rows
-    off0 = 0.5 if (r0 & 1) else 0.0
-    off1 = 0.5 if (r1 & 1) else 0.0
-    off = (1.0 - alpha) * off0 + alpha * off1
-    x = bx + HEX_W * (c + off) + HEX_W * 0.75
-    y = by + HEX_VSTEP * r + HEX_R * 1.1
+    # odd‑r offset is 0.5 on odd rows and 0 on even ones; blending between
+    # row r0 and r0+1 reduces to one multiply
+    off = (1.0 - alpha) * 0.5 if (r0 & 1) else alpha * 0.5
+    x = BOARD_X + HEX_W * (c + off) + PX_X_MARGIN
+    y = BOARD_Y + HEX_VSTEP * r + PX_Y_MARGIN
     return int(x), int(y)
 
-def draw_grid(surf):
-    for r in range(BOARD_H):
-        for c in range(BOARD_W):
-            cx, cy = hex_center((r, c))
-            pygame.draw.polygon(surf, GRID, hex_points(cx, cy), width=2)
+# The hex grid never changes, so it is rendered once into a transparent
+# surface covering just the board and blitted each frame.
+GRID_SURFACE = None
+GRID_SURFACE_POS = (0, 0)
+# Opaque full-window frame background: BG fill with the grid already on it.
+# The grid sits clear of the store/bench panels, so one blit replaces the
+# per-frame fill plus the grid blit.
+BACKGROUND = None
+
+def _build_grid_surface(size=None):
+    """Pre-render the static hex grid and the frame background for a window of
+    `size` (default (W, H)); call after pygame.display.set_mode."""
+    global GRID_SURFACE, GRID_SURFACE_POS, BACKGROUND
+    polys = [hex_points(*hex_center((r, c))) for r in range(BOARD_H) for c in range(BOARD_W)]
+    x0 = int(math.floor(min(x for pts in polys for x, _ in pts))) - 2
+    y0 = int(math.floor(min(y for pts in polys for _, y in pts))) - 2
+    x1 = int(math.ceil(max(x for pts in polys for x, _ in pts))) + 2
+    y1 = int(math.ceil(max(y for pts in polys for _, y in pts))) + 2
+    grid = pygame.Surface((x1 - x0, y1 - y0), pygame.SRCALPHA)
+    for pts in polys:
+        pygame.draw.polygon(grid, GRID, [(x - x0, y - y0) for x, y in pts], width=2)
+    GRID_SURFACE = grid.convert_alpha() if pygame.display.get_surface() else grid
+    GRID_SURFACE_POS = (x0, y0)
+    bg = pygame.Surface(size or (W, H))
+    bg.fill(BG)
+    bg.blit(GRID_SURFACE, GRID_SURFACE_POS)
+    BACKGROUND = bg.convert() if pygame.display.get_surface() else bg
+    return GRID_SURFACE
+
+def draw_background(surf):
+    """Start a frame: clear to BG with the static hex grid in place."""
+    # rebuilt only when missing or when the target's size changes
+    if BACKGROUND is None or BACKGROUND.get_size() != surf.get_size():
+        _build_grid_surface(surf.get_size())
+    surf.blit(BACKGROUND, (0, 0))
 
 # ---------- Bars / HUD ----------
 
+# Rendered text surfaces keyed by (text, color, font). Most HUD strings repeat
+# frame to frame, so rasterizing them once saves the costliest call in the HUD.
+# Least-recently-used entries are evicted first, so one-off strings (e.g. the
+# changing deploy action line) cannot flush the labels drawn every frame.
+_TEXT_CACHE = OrderedDict()
+TEXT_CACHE_MAX = 512
+
+def render_text(font, text, color=WHITE):
+    key = (text, color, id(font))
+    label = _TEXT_CACHE.get(key)
+    if label is None:
+        if len(_TEXT_CACHE) >= TEXT_CACHE_MAX:
+            _TEXT_CACHE.popitem(last=False)
+        label = _TEXT_CACHE[key] = font.render(text, True, color)
+    else:
+        _TEXT_CACHE.move_to_end(key)
+    return label
+
 def draw_text(surf, font, text, x, y, color=WHITE):
-    surf.blit(font.render(text, True, color), (x, y))
+    surf.blit(render_text(font, text, color), (x, y))
 
 
 def draw_bar(surf, x, y, w, h, frac, fg, bg=BAR_BG, border=2):
@@ -146,6 +225,26 @@ def draw_bar(surf, x, y, w, h, frac, fg, bg=BAR_BG, border=2):
     pygame.draw.rect(surf, fg, (x, y, inner_w, h), border_radius=5)
 
 
+def poll_events():
+    """Return the queued QUIT/KEYDOWN events and drop everything else (mouse
+    motion, window events) without walking it in Python."""
+    events = pygame.event.get(HANDLED_EVENTS)
+    pygame.event.clear(pump=False)
+    return events
+
+
+def draw_pause_banner(surf, font):
+    """Overlay a "[PAUSED]" label on the frame already on screen and push just
+    that rect; the next normal frame redraws over it."""
+    label = render_text(font, "[PAUSED]  SPACE to resume", WHITE)
+    rect = label.get_rect(center=(int(BOARD_X + BOARD_PIXEL_W / 2), int(BOARD_Y + BOARD_PIXEL_H / 2)))
+    box = rect.inflate(20, 12)
+    pygame.draw.rect(surf, BG, box, border_radius=6)
+    pygame.draw.rect(surf, TILE_BORDER, box, width=2, border_radius=6)
+    surf.blit(label, rect)
+    pygame.display.update(box)
+
+
 # ---------- Cards: store/bench tiles ----------
 
 def _traits_for_tid(tid):
@@ -189,12 +288,41 @@ def _cost_for_tid(tid):
     return getattr(rules, "CARD_COST_DEFAULT", 3)
 
 
+# "<cost> elixir" label per (tid, font); costs come from the static catalog,
+# so the catalog lookup and the text rendering happen once per card.
+_COST_LABELS = {}
+
+def _cost_label(tid, font_small):
+    key = (tid, id(font_small))
+    label = _COST_LABELS.get(key)
+    if label is None:
+        label = _COST_LABELS[key] = render_text(font_small, f"{_cost_for_tid(tid)} elixir", SUBTLE)
+    return label
+
+
 def _name_for_tid(tid):
     names = getattr(rules, 'TROOP_NAMES', {})
     return names.get(tid, f"ID{tid}")
 
 
+# Pre-rendered card tiles keyed by (tid, w, h, font). A tile's background,
+# trait markers and name never change, so each is painted once and blitted.
+_CARD_TEMPLATES = {}
+
 def card_chip(surf, rect, tid, font_small, font_big):
+    rect = pygame.Rect(rect)
+    key = (tid, rect.w, rect.h, id(font_small))
+    tile = _CARD_TEMPLATES.get(key)
+    if tile is None:
+        tile = pygame.Surface(rect.size, pygame.SRCALPHA)
+        _paint_card_chip(tile, tile.get_rect(), tid, font_small)
+        if pygame.display.get_surface() is not None:
+            tile = tile.convert_alpha()
+        _CARD_TEMPLATES[key] = tile
+    surf.blit(tile, rect.topleft)
+
+
+def _paint_card_chip(surf, rect, tid, font_small):
     pygame.draw.rect(surf, DEFAULT_CARD_BG, rect, border_radius=10)
     pygame.draw.rect(surf, TILE_BORDER, rect, width=2, border_radius=10)
 
@@ -226,7 +354,7 @@ def card_chip(surf, rect, tid, font_small, font_big):
 
     # Name label
     nm = _name_for_tid(tid)
-    label = font_small.render(nm, True, DEFAULT_CARD_FG)
+    label = render_text(font_small, nm, DEFAULT_CARD_FG)
     # clip to tile width
     clip = surf.get_clip()
     surf.set_clip(rect.inflate(-10, -10))
@@ -234,7 +362,61 @@ def card_chip(surf, rect, tid, font_small, font_big):
     surf.set_clip(clip)
 
 
+# Store/bench panels change only when a bot acts, so each one is painted once
+# per distinct content into its own surface and blitted on later frames.
+# Evicted least-recently-used first, like _TEXT_CACHE, so the panels on screen
+# survive a run of one-off states.
+_PANEL_CACHE = OrderedDict()
+PANEL_CACHE_MAX = 64
+_PANEL_SCRATCH = None
+
+def _item_tid(itm):
+    # Accept forms: int id, (id, star), {"troop_id": id}
+    if isinstance(itm, (list, tuple)) and len(itm) >= 1:
+        return itm[0]
+    if isinstance(itm, dict) and 'troop_id' in itm:
+        return itm['troop_id']
+    return itm
+
+def _blit_panel(surf, key, rect, paint):
+    """Blit the cached panel for `key`, painting it via paint(target) first on
+    a miss. paint draws at screen coordinates, so it runs on a window-sized
+    scratch surface and `rect` is cut out of that."""
+    global _PANEL_SCRATCH
+    panel = _PANEL_CACHE.get(key)
+    if panel is None:
+        if _PANEL_SCRATCH is None or _PANEL_SCRATCH.get_size() != surf.get_size():
+            _PANEL_SCRATCH = pygame.Surface(surf.get_size())
+        paint(_PANEL_SCRATCH)
+        panel = _PANEL_SCRATCH.subsurface(rect).copy()
+        if pygame.display.get_surface() is not None:
+            panel = panel.convert()
+        if len(_PANEL_CACHE) >= PANEL_CACHE_MAX:
+            _PANEL_CACHE.popitem(last=False)
+        _PANEL_CACHE[key] = panel
+    else:
+        _PANEL_CACHE.move_to_end(key)
+    surf.blit(panel, rect)
+
+
 def draw_store_row(surf, font_small, font_big, items, owner=0):
+    # items: list of troop_ids (or data with .troop_id)
+    rect = pygame.Rect(SIDE_W, 0 if owner==0 else H-BOT_H, W-2*SIDE_W, TOP_H if owner==0 else BOT_H)
+    key = ('store', owner, tuple(_item_tid(itm) for itm in items[:3]), id(font_small), id(font_big))
+    _blit_panel(surf, key, rect,
+                lambda target: _paint_store_row(target, font_small, font_big, items, owner))
+
+
+def draw_bench_column(surf, font_small, font_big, items, owner=0, hp=None, elixir=None):
+    # items: list of troop_ids (or data)
+    rect = pygame.Rect(0 if owner==0 else W - SIDE_W, 0, SIDE_W, H)
+    key = ('bench', owner, tuple(_item_tid(itm) for itm in items[:5]), hp, elixir,
+           id(font_small), id(font_big))
+    _blit_panel(surf, key, rect,
+                lambda target: _paint_bench_column(target, font_small, font_big, items, owner, hp, elixir))
+
+
+def _paint_store_row(surf, font_small, font_big, items, owner=0):
     # items: list of troop_ids (or data with .troop_id)
     bg = pygame.Rect(SIDE_W, 0 if owner==0 else H-BOT_H, W-2*SIDE_W, TOP_H if owner==0 else BOT_H)
     pygame.draw.rect(surf, (24,24,32), bg)
@@ -253,22 +435,14 @@ def draw_store_row(surf, font_small, font_big, items, owner=0):
         pygame.draw.rect(surf, TILE_BG, rect, border_radius=10)
         pygame.draw.rect(surf, TILE_BORDER, rect, width=2, border_radius=10)
         if i < len(items):
-            itm = items[i]
-            # Accept forms: int id, (id, star), {"troop_id": id}
-            if isinstance(itm, (list, tuple)) and len(itm) >= 1:
-                tid = itm[0]
-            elif isinstance(itm, dict) and 'troop_id' in itm:
-                tid = itm['troop_id']
-            else:
-                tid = itm
+            tid = _item_tid(items[i])
             card_chip(surf, rect, tid, font_small, font_big)
             # Cost label bottom-right
-            cost = _cost_for_tid(int(tid))
-            label = font_small.render(f"{cost} elixir", True, SUBTLE)
+            label = _cost_label(int(tid), font_small)
             surf.blit(label, (rect.right - label.get_width() - 8, rect.bottom - label.get_height() - 6))
 
 
-def draw_bench_column(surf, font_small, font_big, items, owner=0, hp=None, elixir=None):
+def _paint_bench_column(surf, font_small, font_big, items, owner=0, hp=None, elixir=None):
     # items: list of troop_ids (or data)
     x = 0 if owner==0 else W - SIDE_W
     bg = pygame.Rect(x, 0, SIDE_W, H)
@@ -285,7 +459,7 @@ def draw_bench_column(surf, font_small, font_big, items, owner=0, hp=None, elixi
         elixir = 0
 
     # Determine max king HP if exposed in rules, else default to 10
-    king_hp_max = getattr(rules, 'KING_HP_MAX', 10)
+    king_hp_max = KING_HP_MAX
     hp_frac = float(hp) / max(1.0, float(king_hp_max))
 
     # King HP bar
@@ -296,12 +470,12 @@ def draw_bench_column(surf, font_small, font_big, items, owner=0, hp=None, elixi
 
     # King HP number overlay (e.g., "HP: 8/10")
     hp_text = f"HP: {int(hp)}/{int(king_hp_max)}"
-    txt = font_small.render(hp_text, True, WHITE)
+    txt = render_text(font_small, hp_text, WHITE)
     surf.blit(txt, (hp_bar_x, hp_bar_y - txt.get_height() - 2))
 
     # Elixir as a number (no bar)
     elixir_text = f"Elixir: {int(elixir)}"
-    etxt = font_small.render(elixir_text, True, SUBTLE)
+    etxt = render_text(font_small, elixir_text, SUBTLE)
     surf.blit(etxt, (x + 12, 58))
 
     # Slots (vertical list)
@@ -313,14 +487,7 @@ def draw_bench_column(surf, font_small, font_big, items, owner=0, hp=None, elixi
         pygame.draw.rect(surf, TILE_BG, rect, border_radius=10)
         pygame.draw.rect(surf, TILE_BORDER, rect, width=2, border_radius=10)
         if i < len(items):
-            itm = items[i]
-            # Bench entries can be (id, star), dict, or int id
-            if isinstance(itm, (list, tuple)) and len(itm) >= 1:
-                tid = itm[0]
-            elif isinstance(itm, dict) and 'troop_id' in itm:
-                tid = itm['troop_id']
-            else:
-                tid = itm
+            tid = _item_tid(items[i])
             card_chip(surf, rect, tid, font_small, font_big)
 
 
@@ -450,6 +617,18 @@ def _snapshot_units(units_dict):
     return snap
 
 
+def _deploy_snapshot(pre_state):
+    """Build the snapshot dict build_engine_from_snapshot expects from the
+    shallow (units0, units1, shop0, shop1, bench0, bench1) copies taken
+    before a deploy step."""
+    units0, units1, shop0, shop1, bench0, bench1 = pre_state
+    return {
+        "units": {0: _snapshot_units(units0), 1: _snapshot_units(units1)},
+        "shops": {0: shop0, 1: shop1},
+        "benches": {0: _normalize_bench(bench0), 1: _normalize_bench(bench1)},
+    }
+
+
 def _normalize_bench(items):
     """Return a list of (card_id, star) tuples from arbitrary bench entries."""
     out = []
@@ -485,18 +664,26 @@ def _apply_projectile_speed_scale(unit):
 
     try:
         if callable(attr):
+            # The engine asks for projectile_speed() on every attack, and the
+            # Unit method re-resolves the card spec each time; the speed is
+            # fixed per card, so the scaled value is computed on first use.
+            memo = []
             def _scaled(attr=attr, scale=scale):
+                if memo:
+                    return memo[0]
                 try:
                     val = attr()
                 except Exception:
-                    return 0.0
-                try:
-                    val_f = float(val)
-                except Exception:
-                    return val
-                if val_f <= 0.0:
-                    return val_f
-                return val_f * scale
+                    val = 0.0
+                else:
+                    try:
+                        val_f = float(val)
+                    except Exception:
+                        pass
+                    else:
+                        val = val_f if val_f <= 0.0 else val_f * scale
+                memo.append(val)
+                return val
             setattr(unit, "projectile_speed", _scaled)
         else:
             val = float(attr)
@@ -598,54 +785,41 @@ def env_step_with_mask(env, action):
 # Drawing board units & projectiles
 # ==============================
 
-def draw_unit(surf, unit, owner, font_small=None):
-    cx, cy = pos_to_px(unit.pos[0], unit.pos[1])
-    color = P0C if owner == 0 else P1C
+def _num(x):
+    """Coerce raw numbers or scraper dicts like {"value": 3, "unit": "tiles"}."""
+    try:
+        if isinstance(x, dict) and "value" in x:
+            return float(x["value"])
+        return float(x)
+    except Exception:
+        return 0.0
 
-    # Shape: melee = circle, ranged = diamond.
-    # Consider a unit "ranged" if it either has projectile_speed > 0
-    # OR its range (in tiles) is >= 2. We handle both callables and raw values,
-    # and also dict-like values from the scraper (e.g., {"value": 3, "unit": "tiles"}).
-    def _num(x):
-        try:
-            if isinstance(x, dict) and "value" in x:
-                return float(x["value"])
-            return float(x)
-        except Exception:
-            return 0.0
 
-    def _val(attr, default):
-        try:
-            v = getattr(unit, attr, default)
-            return v() if callable(v) else v
-        except Exception:
-            return default
+def _unit_val(unit, attr, default):
+    try:
+        v = getattr(unit, attr, default)
+        return v() if callable(v) else v
+    except Exception:
+        return default
 
-    rng_tiles = _num(_val("range", 1))
-    proj_speed = _num(_val("projectile_speed", 0))
-    is_ranged = (proj_speed > 0.0) or (rng_tiles >= 2.0)
-    if not is_ranged:
-        pygame.draw.circle(surf, color, (cx, cy), int(HEX_R * 0.71))
-    else:
-        s = int(HEX_R * 0.66)
-        pts = [(cx, cy-s), (cx+s, cy), (cx, cy+s), (cx-s, cy)]
-        pygame.draw.polygon(surf, color, pts)
 
-    # Show unit name above icon
-    if font_small is not None:
-        nm = rules.TROOP_NAMES.get(getattr(unit, 'card_id', getattr(unit, 'troop_id', -1)), "")
-        if nm:
-            name_label = font_small.render(nm, True, SUBTLE)
-            surf.blit(name_label, (cx - name_label.get_width()//2, cy - int(HEX_R*1.25)))
+# Ranged-ness depends only on the card, so it is probed once per (unit class,
+# card id) rather than through range()/projectile_speed() on every draw.
+_IS_RANGED_CACHE = {}
+
+def _unit_is_ranged(unit):
+    key = (unit.__class__, getattr(unit, 'card_id', getattr(unit, 'troop_id', -1)))
+    ranged = _IS_RANGED_CACHE.get(key)
+    if ranged is None:
+        # Consider a unit "ranged" if it either has projectile_speed > 0
+        # OR its range (in tiles) is >= 2. We handle both callables and raw values.
+        rng_tiles = _num(_unit_val(unit, "range", 1))
+        proj_speed = _num(_unit_val(unit, "projectile_speed", 0))
+        ranged = _IS_RANGED_CACHE[key] = (proj_speed > 0.0) or (rng_tiles >= 2.0)
+    return ranged
 
-    # star pips
-    pip = int(HEX_R * 0.14)
-    gap = int(HEX_R * 0.32)
-    start_x = cx - gap
-    for i in range(int(getattr(unit, 'star', 1))):
-        pygame.draw.circle(surf, WHITE, (start_x + i*gap, cy - int(HEX_R * 0.95)), pip)
 
-    # hp bar
+def _unit_max_hp(unit):
     max_hp = getattr(unit, "_viewer_max_hp", None)
     if max_hp is None:
         max_hp = (
@@ -658,142 +832,303 @@ def draw_unit(surf, unit, owner, font_small=None):
             max_hp = max(1.0, float(getattr(unit, 'hp', 1.0)))
         except Exception:
             max_hp = 1.0
-    cur_hp = float(getattr(unit, 'hp', 0.0))
-    ratio = 0.0 if max_hp <= 0 else (cur_hp / float(max_hp))
+    return max_hp
+
+
+# Unit sprite geometry, all derived from HEX_R/HEX_W and fixed for the run.
+UNIT_CIRCLE_R = int(HEX_R * 0.71)
+UNIT_DIAMOND_S = int(HEX_R * 0.66)
+UNIT_NAME_DY = int(HEX_R * 1.25)
+PIP_R = int(HEX_R * 0.14)
+PIP_GAP = int(HEX_R * 0.32)
+PIP_DY = int(HEX_R * 0.95)
+HP_BAR_SPAN = HEX_W * 0.55      # full-health bar width (float, scaled by hp ratio)
+HP_BAR_W = int(HP_BAR_SPAN)
+HP_BAR_DX = int(HEX_W * 0.275)
+HP_BAR_DY = int(HEX_R * 0.8)
+HP_BAR_BG = (80, 80, 90)
+HP_BAR_FG = (80, 255, 120)
+
+
+# Unit sprites (shape + name + star pips) keyed by what they depend on:
+# (owner, tid, ranged, star, font). Only the HP bar is drawn per frame.
+_UNIT_SPRITES = {}
+
+def _unit_sprite(owner, tid, ranged, star, font_small):
+    """Return (surface, (ox, oy)) where (ox, oy) is the unit center inside it."""
+    key = (owner, tid, ranged, star, id(font_small) if font_small is not None else None)
+    hit = _UNIT_SPRITES.get(key)
+    if hit is not None:
+        return hit
+    name_label = None
+    if font_small is not None:
+        nm = rules.TROOP_NAMES.get(tid, "")
+        if nm:
+            name_label = render_text(font_small, nm, SUBTLE)
+    nw = name_label.get_width() if name_label is not None else 0
+    left = max(nw // 2, UNIT_CIRCLE_R, PIP_GAP + PIP_R) + 2
+    right = max(nw - nw // 2, UNIT_CIRCLE_R, (star - 2) * PIP_GAP + PIP_R) + 2
+    top = max(UNIT_NAME_DY, PIP_DY + PIP_R, UNIT_CIRCLE_R) + 2
+    bottom = UNIT_CIRCLE_R + 2
+    sprite = pygame.Surface((left + right, top + bottom), pygame.SRCALPHA)
+    cx, cy = left, top
+    color = P0C if owner == 0 else P1C
+
+    # Shape: melee = circle, ranged = diamond.
+    if not ranged:
+        pygame.draw.circle(sprite, color, (cx, cy), UNIT_CIRCLE_R)
+    else:
+        s = UNIT_DIAMOND_S
+        pts = [(cx, cy-s), (cx+s, cy), (cx, cy+s), (cx-s, cy)]
+        pygame.draw.polygon(sprite, color, pts)
+
+    # Show unit name above icon
+    if name_label is not None:
+        sprite.blit(name_label, (cx - nw//2, cy - UNIT_NAME_DY))
+
+    # star pips
+    start_x = cx - PIP_GAP
+    pip_y = cy - PIP_DY
+    for i in range(star):
+        pygame.draw.circle(sprite, WHITE, (start_x + i*PIP_GAP, pip_y), PIP_R)
+
+    if pygame.display.get_surface() is not None:
+        sprite = sprite.convert_alpha()
+    hit = _UNIT_SPRITES[key] = (sprite, (cx, cy))
+    return hit
+
+
+def _draw_hp_bar(surf, cx, cy, hp, max_hp):
+    ratio = 0.0 if max_hp <= 0 else (hp / float(max_hp))
     if ratio < 0.0:
         ratio = 0.0
     elif ratio > 1.0:
         ratio = 1.0
-    hp_w = int(ratio * (HEX_W * 0.55))
-    bar_x = cx - int(HEX_W * 0.275)
-    bar_y = cy + int(HEX_R * 0.8)
-    pygame.draw.rect(surf, (80,80,90), (bar_x, bar_y, int(HEX_W*0.55), 6), border_radius=3)
-    pygame.draw.rect(surf, (80,255,120), (bar_x, bar_y, max(0, hp_w), 6), border_radius=3)
+    hp_w = int(ratio * HP_BAR_SPAN)
+    bar_x = cx - HP_BAR_DX
+    bar_y = cy + HP_BAR_DY
+    # flat bars: Surface.fill is a straight C rect fill, unlike the rounded
+    # draw.rect path
+    surf.fill(HP_BAR_BG, (bar_x, bar_y, HP_BAR_W, 6))
+    if hp_w > 0:
+        surf.fill(HP_BAR_FG, (bar_x, bar_y, hp_w, 6))
+
+
+# Deploy-board draw records keyed by id(unit): the board is redrawn every
+# frame while its units stay put. Each record holds its unit, so a cached id
+# cannot be reused by a new object; deploy actions replace Unit objects
+# (merges rebuild them), so a cached record never goes stale. Cleared whenever
+# visualize_deploy starts on a fresh board.
+_UNIT_DRAW_CACHE = {}
+
+def draw_units(surf, owned_units, font_small=None):
+    """Draw (owner, unit) pairs: every sprite goes out in one Surface.blits
+    call, then the HP bars are drawn on top. Records come from
+    _UNIT_DRAW_CACHE, tagged with the owner and font they were built for."""
+    records = []
+    for owner, unit in owned_units:
+        tag = (owner, id(font_small))
+        cached = _UNIT_DRAW_CACHE.get(id(unit))
+        if cached is None or cached[0] != tag:
+            cached = _UNIT_DRAW_CACHE[id(unit)] = (
+                tag, _unit_draw_records(((owner, unit),), font_small)[0])
+        records.append(cached[1])
+    draw_unit_records(surf, records)
+
+
+def _unit_draw_records(owned_units, font_small=None):
+    """Resolve everything about (owner, unit) pairs that stays fixed for a
+    battle -- sprite, its anchor and max HP -- into (unit, sprite, ox, oy,
+    max_hp) records. Only position and hp are read per frame after this."""
+    records = []
+    for owner, unit in owned_units:
+        sprite, (ox, oy) = _unit_sprite(
+            owner,
+            getattr(unit, 'card_id', getattr(unit, 'troop_id', -1)),
+            _unit_is_ranged(unit),
+            int(getattr(unit, 'star', 1)),
+            font_small,
+        )
+        records.append((unit, sprite, ox, oy, _unit_max_hp(unit)))
+    return records
+
+
+def draw_unit_records(surf, records):
+    """draw_units for records from _unit_draw_records."""
+    blits = []
+    bars = []
+    for unit, sprite, ox, oy, max_hp in records:
+        pos = unit.pos
+        cx, cy = pos_to_px(pos[0], pos[1])
+        blits.append((sprite, (cx - ox, cy - oy)))
+        bars.append((cx, cy, unit.hp, max_hp))
+    surf.blits(blits, doreturn=False)
+    for cx, cy, hp, max_hp in bars:
+        _draw_hp_bar(surf, cx, cy, hp, max_hp)
+
+
+def _interp_projectiles(projectiles):
+    """Place projectiles along their start->target path from time remaining.
+    Position is only ever read for drawing, so this runs once per frame rather
+    than after every engine substep."""
+    for p in projectiles:
+        t0 = getattr(p, "_draw_tremain0", None)
+        if t0 is None:
+            continue
+        frac = 1.0 - (p.remaining / t0)
+        frac = 0.0 if frac < 0.0 else (1.0 if frac > 1.0 else frac)
+        p.r = p.sr + (p.tr - p.sr) * frac
+        p.c = p.sc + (p.tc - p.sc) * frac
+
+
+PROJ_R = max(3, int(HEX_R * 0.15))
+_PROJ_SPRITES = {}
 
+def _projectile_sprite(owner):
+    sprite = _PROJ_SPRITES.get(owner)
+    if sprite is None:
+        sprite = pygame.Surface((2 * PROJ_R + 2, 2 * PROJ_R + 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, P0C if owner == 0 else P1C, (PROJ_R + 1, PROJ_R + 1), PROJ_R)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        _PROJ_SPRITES[owner] = sprite
+    return sprite
 
-def draw_projectile(surf, p):
-    cx, cy = pos_to_px(p.r, p.c)
-    color = P0C if p.owner == 0 else P1C
-    pygame.draw.circle(surf, color, (cx, cy), max(3, int(HEX_R * 0.15)))
+
+def draw_projectiles(surf, projectiles):
+    """Blit every projectile from a cached per-owner dot in one call."""
+    blits = []
+    for p in projectiles:
+        cx, cy = pos_to_px(p.r, p.c)
+        blits.append((_projectile_sprite(p.owner), (cx - PROJ_R - 1, cy - PROJ_R - 1)))
+    surf.blits(blits, doreturn=False)
 
 
 # ==============================
 # Deploy visualizer
 # ==============================
 
+def _panel_rects():
+    """Screen rects of the P0/P1 store rows and the P0/P1 bench columns."""
+    return [
+        pygame.Rect(SIDE_W, 0, W - 2 * SIDE_W, TOP_H),
+        pygame.Rect(SIDE_W, H - BOT_H, W - 2 * SIDE_W, BOT_H),
+        pygame.Rect(0, 0, SIDE_W, H),
+        pygame.Rect(W - SIDE_W, 0, SIDE_W, H),
+    ]
+
+
+def _present_deploy_frame(panel_state, shown, board_dirty, panels):
+    """Push a drawn deploy frame. The board and footer always go out; a store
+    or bench panel is pushed only when its entry in `panel_state` differs from
+    the last frame pushed (`shown`, updated in place). The first frame is a
+    full flip. Entries must be copies, not the env's live lists."""
+    if shown[0] is None:
+        pygame.display.flip()
+    else:
+        pygame.display.update(board_dirty + [r for r, a, b in zip(panels, panel_state, shown) if a != b])
+    shown[:] = panel_state
+
+
 def visualize_deploy(screen, font_big, font_small, env, b0, b1, delay_ms=DEPLOY_DELAY_MS_DEFAULT):
-    obs, mask = env.observe()
-    action_text = "Start deploy"
     clock = pygame.time.Clock()
+    # what the store/bench panels on screen currently show (None until the
+    # first flip), and the regions that change on every deploy frame
+    shown = [None] * 4
+    board_dirty = _battle_dirty_rects(font_small)
+    panels = _panel_rects()
+    _UNIT_DRAW_CACHE.clear()
 
     while not (env.p0.actions_left == 0 and env.p1.actions_left == 0):
-        screen.fill(BG)
-        # pull fresh obs each frame for UI drawing
-        obs, _mask_now = env.observe()
-        mask = _mask_now
+        obs, mask = env.observe()
+        p0, p1 = env.p0, env.p1
+        turn = env.turn
+
+        # choose first, so one frame shows the board together with the
+        # action about to be applied
+        bot = b0 if turn == 0 else b1
+        action = bot.act(obs, mask)
+        action_text = f"P{turn} -> {action[0]} {action[1]}"
+
+        draw_background(screen)
 
         # stores & benches
-        p0_store = obs.get('p0_shop', [])
-        p1_store = obs.get('p1_shop', [])
-        p0_bench = getattr(env.p0, 'bench', [])
-        p1_bench = getattr(env.p1, 'bench', [])
+        p0_store = obs.get('p0_shop', EMPTY)
+        p1_store = obs.get('p1_shop', EMPTY)
+        p0_bench = getattr(p0, 'bench', EMPTY)
+        p1_bench = getattr(p1, 'bench', EMPTY)
+        p0_hp, p1_hp = getattr(p0, 'base_hp', 10), getattr(p1, 'base_hp', 10)
+        p0_elixir, p1_elixir = getattr(p0, 'elixir', 0), getattr(p1, 'elixir', 0)
         draw_store_row(screen, font_small, font_big, p0_store, owner=0)
         draw_store_row(screen, font_small, font_big, p1_store, owner=1)
         draw_bench_column(screen, font_small, font_big, p0_bench, owner=0,
-                          hp=getattr(env.p0, 'base_hp', 10),
-                          elixir=getattr(env.p0, 'elixir', 0))
+                          hp=p0_hp, elixir=p0_elixir)
         draw_bench_column(screen, font_small, font_big, p1_bench, owner=1,
-                          hp=getattr(env.p1, 'base_hp', 10),
-                          elixir=getattr(env.p1, 'elixir', 0))
+                          hp=p1_hp, elixir=p1_elixir)
 
         # board
-        draw_grid(screen)
-        for (r,c), u in env.p0.units.items():
-            draw_unit(screen, u, 0, font_small)
-        for (r,c), u in env.p1.units.items():
-            draw_unit(screen, u, 1, font_small)
+        draw_units(screen, [(0, u) for u in p0.units.values()]
+                   + [(1, u) for u in p1.units.values()], font_small)
 
         # footer deploy hint centered under board
-        bx, by = board_origin()
-        draw_text(screen, font_small, f"Action: {action_text}   (± to change speed, SPACE pause)", bx, by + int(BOARD_PIXEL_H) + 8)
+        draw_text(screen, font_small, f"Action: {action_text}   (± to change speed, SPACE pause)", BOARD_X, BOARD_Y + int(BOARD_PIXEL_H) + 8)
 
-        pygame.display.flip()
+        _present_deploy_frame(
+            [list(p0_store), list(p1_store),
+             (list(p0_bench), p0_hp, p0_elixir), (list(p1_bench), p1_hp, p1_elixir)],
+            shown, board_dirty, panels)
 
         # hotkeys
-        for ev in pygame.event.get():
+        for ev in poll_events():
             if ev.type == pygame.QUIT:
                 return None
             if ev.type == pygame.KEYDOWN:
-                if ev.key == pygame.K_MINUS:
-                    delay_ms = min(1000, delay_ms + 50)
-                elif ev.key in (pygame.K_EQUALS, pygame.K_PLUS):
-                    delay_ms = max(0, delay_ms - 50)
+                if ev.key in DELAY_KEYS:
+                    delay_ms = min(1000, max(0, delay_ms + DELAY_KEYS[ev.key]))
                 elif ev.key == pygame.K_SPACE:
-                    # simple modal pause
+                    # simple modal pause: the frame on screen stays as-is
+                    # (plus a banner); nothing is redrawn until resume
+                    draw_pause_banner(screen, font_small)
                     paused = True
                     while paused:
-                        for ev2 in pygame.event.get():
+                        for ev2 in poll_events():
                             if ev2.type == pygame.QUIT:
                                 return None
                             if ev2.type == pygame.KEYDOWN and ev2.key == pygame.K_SPACE:
                                 paused = False
-                        pygame.time.Clock().tick(60)
+                        clock.tick(30)
                 elif ev.key == pygame.K_ESCAPE:
                     return None
-        clock.tick(60)
-        pygame.time.delay(delay_ms)
-
-        # Snapshot full deploy state so we can rebuild the battle board if this action ends deploy.
-        snapshot = {
-            "units": {
-                0: _snapshot_units(env.p0.units),
-                1: _snapshot_units(env.p1.units),
-            },
-            "shops": {
-                0: list(getattr(env.p0, 'shop', [])),
-                1: list(getattr(env.p1, 'shop', [])),
-            },
-            "benches": {
-                0: _normalize_bench(getattr(env.p0, 'bench', [])),
-                1: _normalize_bench(getattr(env.p1, 'bench', [])),
-            },
-        }
-
-        # choose & step
-        bot = b0 if env.turn == 0 else b1
-        action = bot.act(obs, mask)
-        action_text = f"P{env.turn} -> {action[0]} {action[1]}"
-        # Immediate feedback of chosen action in HUD
-        screen.fill(BG)
-        draw_store_row(screen, font_small, font_big, obs.get('p0_shop', []), owner=0)
-        draw_store_row(screen, font_small, font_big, obs.get('p1_shop', []), owner=1)
-        draw_bench_column(screen, font_small, font_big, getattr(env.p0, 'bench', []), owner=0,
-                          hp=getattr(env.p0, 'base_hp', 10), elixir=getattr(env.p0, 'elixir', 0))
-        draw_bench_column(screen, font_small, font_big, getattr(env.p1, 'bench', []), owner=1,
-                          hp=getattr(env.p1, 'base_hp', 10), elixir=getattr(env.p1, 'elixir', 0))
-        draw_grid(screen)
-        for (r,c), u in env.p0.units.items():
-            draw_unit(screen, u, 0, font_small)
-        for (r,c), u in env.p1.units.items():
-            draw_unit(screen, u, 1, font_small)
-        bx, by = board_origin()
-        draw_text(screen, font_small, f"Action: {action_text}   (± to change speed, SPACE pause)", bx, by + int(BOARD_PIXEL_H) + 8)
-        pygame.display.flip()
+        # one pacing call: a ~16 ms frame plus the deploy delay, instead of
+        # tick(60) followed by a blocking delay
+        clock.tick(1000.0 / (delay_ms + 16))
+
+        # Keep the pre-step deploy state so we can rebuild the battle board if
+        # this action ends deploy. Deploy actions replace Unit objects rather
+        # than mutating them, so shallow copies suffice; they are normalized
+        # into a snapshot only when actually needed.
+        pre_state = (
+            dict(p0.units), dict(p1.units),
+            list(getattr(p0, 'shop', EMPTY)), list(getattr(p1, 'shop', EMPTY)),
+            list(p0_bench), list(p1_bench),
+        )
+
+        # step
         prev_round = env.round
-        actor = env.turn
+        actor = turn
         obs, mask, reward, done, info = env_step_with_mask(env, action)
 
         if env.round > prev_round:
             seeded = build_engine_from_seed(env)
             if seeded is not None:
                 return seeded
-            return build_engine_from_snapshot(env, snapshot, action, actor)
+            return build_engine_from_snapshot(env, _deploy_snapshot(pre_state), action, actor)
 
         if env.p0.actions_left == 0 and env.p1.actions_left == 0:
             seeded = build_engine_from_seed(env)
             if seeded is not None:
                 return seeded
-            return build_engine_from_snapshot(env, snapshot, action, actor)
+            return build_engine_from_snapshot(env, _deploy_snapshot(pre_state), action, actor)
 
     return None
 
@@ -802,6 +1137,34 @@ def visualize_deploy(screen, font_big, font_small, env, b0, b1, delay_ms=DEPLOY_
 # Battle visualizer
 # ==============================
 
+def _battle_dirty_rects(font_small):
+    """Screen regions that change between battle frames: the board (including
+    unit labels that overhang into the store bars) and the footer line, which
+    can run under the right bench column."""
+    top_cy = HEX_CENTERS[0][0][1]
+    bot_cy = HEX_CENTERS[BOARD_H - 1][0][1]
+    top = max(0, top_cy - UNIT_NAME_DY - 2)
+    bottom = min(H, bot_cy + HP_BAR_DY + 6 + 2)
+    board = pygame.Rect(SIDE_W, top, W - 2 * SIDE_W, bottom - top)
+    footer_y = BOARD_Y + int(BOARD_PIXEL_H) + 8
+    footer = pygame.Rect(BOARD_X, footer_y, W - BOARD_X, font_small.get_linesize())
+    return [board, footer]
+
+
+def _ff_until_end(engine, t, dt, t_end):
+    """Fast-forward: step the engine until one side is wiped or t reaches
+    t_end, with no rendering, event polling or projectile draw bookkeeping.
+    Returns the final t."""
+    setattr(rules, "USE_PROJECTILES", True)
+    step = engine.step
+    # the engine keeps its own running alive counts
+    counts = engine.alive_count
+    while t < t_end and counts[0] and counts[1]:
+        step(dt)
+        t += dt
+    return t
+
+
 def visualize_battle(screen, font_big, font_small, env, speed=1.0, engine=None):
     engine = engine or build_engine_from_env(env)
     clock = pygame.time.Clock()
@@ -823,90 +1186,118 @@ def visualize_battle(screen, font_big, font_small, env, speed=1.0, engine=None):
                 p.tr = float(tgt.pos[0]); p.tc = float(tgt.pos[1])
                 p.sr = float(p.r); p.sc = float(p.c)
                 p._draw_tremain0 = max(1e-6, p.remaining)
-        for p in engine.projectiles:
-            if hasattr(p, "_draw_tremain0"):
-                frac = 1.0 - (p.remaining / p._draw_tremain0)
-                frac = 0.0 if frac < 0.0 else (1.0 if frac > 1.0 else frac)
-                p.r = p.sr + (p.tr - p.sr) * frac
-                p.c = p.sc + (p.tc - p.sc) * frac
 
     t = 0.0
     dt = SUB_TICK_DT
-    max_t = MAX_BATTLE_TIME
-    abs_cap = ABSOLUTE_BATTLE_TIME_CAP
-    end_on_wipe = END_ONLY_ON_WIPE
-
-    def time_remaining():
-        return (t < abs_cap) if end_on_wipe else (t < max_t)
-
-    while time_remaining():
-        obs, _mask_now = env.observe()
-        p0_alive = sum(1 for o,u in engine.units if o==0 and u.is_alive())
-        p1_alive = sum(1 for o,u in engine.units if o==1 and u.is_alive())
+    # the battle ends at the absolute cap when only a wipe ends it, else at
+    # MAX_BATTLE_TIME; pick the limit once instead of per iteration
+    t_end = ABSOLUTE_BATTLE_TIME_CAP if END_ONLY_ON_WIPE else MAX_BATTLE_TIME
+
+    first_frame = True
+    battle_dirty = _battle_dirty_rects(font_small)
+
+    # The footer's key legend never changes, so it comes from the text cache;
+    # only the status part ahead of it is re-rasterized, and then only every
+    # FOOTER_REFRESH_FRAMES frames or when a side loses a unit.
+    footer_pos = (BOARD_X, BOARD_Y + int(BOARD_PIXEL_H) + 8)
+    footer_hint = render_text(font_small, "(SPACE pause, 1..5 speed, F ffwd)")
+    status = status_alive = None
+    frame = 0
+
+    # Units never revive and none are added mid-battle, so only the units
+    # alive now are ever drawn; sprites/max HP never change mid-battle either,
+    # so resolve them once. The engine's alive counts end the battle and feed
+    # the footer; the draw list is only re-filtered when those counts drop.
+    live = [(o, u) for o, u in engine.units if u.is_alive()]
+    unit_draws = _unit_draw_records(live, font_small)
+    drawn_alive = engine.alive_counts()
+
+    # The env does not change while the battle plays out, so the panel
+    # inputs (including the shops from observe()) are read once instead of
+    # on every frame.
+    p0, p1 = env.p0, env.p1
+    p0_bench = getattr(p0, 'bench', EMPTY)
+    p1_bench = getattr(p1, 'bench', EMPTY)
+    p0_hp, p1_hp = getattr(p0, 'base_hp', 10), getattr(p1, 'base_hp', 10)
+    p0_elixir, p1_elixir = getattr(p0, 'elixir', 0), getattr(p1, 'elixir', 0)
+    obs, _mask = env.observe()
+    p0_store = obs.get('p0_shop', EMPTY)
+    p1_store = obs.get('p1_shop', EMPTY)
+
+    # Fixed-timestep accumulator: wall time since the last frame, scaled by
+    # the speed setting, buys whole SUB_TICK_DT steps and the remainder carries
+    # over, so simulated time tracks the clock rather than the frame rate.
+    frame_ms = 1000.0 / BATTLE_FPS
+    elapsed_ms = frame_ms
+    acc = 0.0
+
+    while t < t_end:
+        p0_alive, p1_alive = engine.alive_counts()
         if p0_alive == 0 or p1_alive == 0:
             break
 
-        substeps = max(1, int(speed * SPEED_MULT * BATTLE_BASE_SPEED))
+        acc += min(elapsed_ms, MAX_FRAME_MS) / frame_ms * speed * SPEED_MULT * BATTLE_BASE_SPEED
+        substeps = int(acc)
+        acc -= substeps
         for _ in range(substeps):
             wrap_step(dt)
             t += dt
+        if engine.alive_counts() != drawn_alive:
+            unit_draws = [d for d in unit_draws if d[0].is_alive()]
+            drawn_alive = engine.alive_counts()
 
-        screen.fill(BG)
+        draw_background(screen)
 
         # stores & benches
-        p0_store = obs.get('p0_shop', [])
-        p1_store = obs.get('p1_shop', [])
-        p0_bench = getattr(env.p0, 'bench', [])
-        p1_bench = getattr(env.p1, 'bench', [])
         draw_store_row(screen, font_small, font_big, p0_store, owner=0)
         draw_store_row(screen, font_small, font_big, p1_store, owner=1)
         draw_bench_column(screen, font_small, font_big, p0_bench, owner=0,
-                          hp=getattr(env.p0, 'base_hp', 10),
-                          elixir=getattr(env.p0, 'elixir', 0))
+                          hp=p0_hp, elixir=p0_elixir)
         draw_bench_column(screen, font_small, font_big, p1_bench, owner=1,
-                          hp=getattr(env.p1, 'base_hp', 10),
-                          elixir=getattr(env.p1, 'elixir', 0))
+                          hp=p1_hp, elixir=p1_elixir)
 
         # board
-        draw_grid(screen)
-        for owner, u in engine.units:
-            if u.is_alive():
-                draw_unit(screen, u, owner, font_small)
-        for p in engine.projectiles:
-            draw_projectile(screen, p)
+        draw_unit_records(screen, unit_draws)
+        _interp_projectiles(engine.projectiles)
+        draw_projectiles(screen, engine.projectiles)
 
         # footer status
-        bx, by = board_origin()
-        draw_text(screen, font_small, f"BATTLE t={t:0.1f}s  Alive P0={p0_alive} P1={p1_alive}  (SPACE pause, 1..5 speed, F ffwd)", bx, by + int(BOARD_PIXEL_H) + 8)
-
-        pygame.display.flip()
-        for ev in pygame.event.get():
+        if status is None or frame % FOOTER_REFRESH_FRAMES == 0 or status_alive != (p0_alive, p1_alive):
+            status = font_small.render(f"BATTLE t={t:0.1f}s  Alive P0={p0_alive} P1={p1_alive}  ", True, WHITE)
+            status_alive = (p0_alive, p1_alive)
+        screen.blit(status, footer_pos)
+        screen.blit(footer_hint, (footer_pos[0] + status.get_width(), footer_pos[1]))
+        frame += 1
+
+        # Stores and benches are static for the whole battle, so after the
+        # first full flip only the board and the footer line are pushed.
+        if first_frame:
+            pygame.display.flip()
+            first_frame = False
+        else:
+            pygame.display.update(battle_dirty)
+        for ev in poll_events():
             if ev.type == pygame.QUIT:
                 return
             if ev.type == pygame.KEYDOWN:
                 if ev.key == pygame.K_ESCAPE:
                     return
                 if ev.key == pygame.K_SPACE:
+                    draw_pause_banner(screen, font_small)
                     paused = True
                     while paused:
-                        for ev2 in pygame.event.get():
+                        for ev2 in poll_events():
                             if ev2.type == pygame.KEYDOWN and ev2.key == pygame.K_SPACE:
                                 paused = False
-                            if ev2.type == pygame.KEYDOWN and ev2.key in (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5):
-                                SPEED_MULT = {pygame.K_1:1.0, pygame.K_2:2.0, pygame.K_3:4.0, pygame.K_4:8.0, pygame.K_5:16.0}[ev2.key]
-                        pygame.time.Clock().tick(60)
-                if ev.key in (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5):
-                    SPEED_MULT = {pygame.K_1:1.0, pygame.K_2:2.0, pygame.K_3:4.0, pygame.K_4:8.0, pygame.K_5:16.0}[ev.key]
+                            if ev2.type == pygame.KEYDOWN and ev2.key in SPEED_KEYS:
+                                SPEED_MULT = SPEED_KEYS[ev2.key]
+                        clock.tick(30)
+                if ev.key in SPEED_KEYS:
+                    SPEED_MULT = SPEED_KEYS[ev.key]
                 if ev.key == pygame.K_f:
-                    while time_remaining():
-                        p0_alive = sum(1 for o,u in engine.units if o==0 and u.is_alive())
-                        p1_alive = sum(1 for o,u in engine.units if o==1 and u.is_alive())
-                        if p0_alive == 0 or p1_alive == 0:
-                            break
-                        wrap_step(dt)
-                        t += dt
+                    t = _ff_until_end(engine, t, dt, t_end)
                     break
-        pygame.time.Clock().tick(60)
+        elapsed_ms = clock.tick(BATTLE_FPS)
 
 
 # ==============================
@@ -916,6 +1307,11 @@ def visualize_battle(screen, font_big, font_small, env, speed=1.0, engine=None):
 def main():
     pygame.init()
     screen = pygame.display.set_mode((W, H))
+    _build_grid_surface()
+    # only quit and key presses are handled; keep mouse motion and the rest
+    # out of the queue the loops drain every frame
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(list(HANDLED_EVENTS))
     pygame.display.set_caption("Merge Tactics – Arena Viewer")
     font_big = pygame.font.SysFont("Menlo,Consolas,monospace", 22)
     font_small = pygame.font.SysFont("Menlo,Consolas,monospace", 18)
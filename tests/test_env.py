@@ -22,3 +22,21 @@ def test_play_two_bots():
         if done:
             assert env.p0.base_hp <= 0 or env.p1.base_hp <= 0 or env.round > 1
             break
+
+def test_battle_alive_counts_track_deaths():
+    from mergetactics import rules
+    from mergetactics.env import BattleEngine, _unit_make
+    units = [
+        [0, _unit_make(card_or_troop_id=rules.TROOP_IDS[0], star=1, pos=(0, 0))],
+        [0, _unit_make(card_or_troop_id=rules.TROOP_IDS[-1], star=1, pos=(0, 2))],
+        [1, _unit_make(card_or_troop_id=rules.TROOP_IDS[0], star=1, pos=(rules.BOARD_ROWS - 1, 0))],
+    ]
+    engine = BattleEngine(units=units)
+    assert engine.alive_counts() == (2, 1)
+    for _ in range(3000):
+        engine.step(rules.SUB_TICK_DT)
+        expected = tuple(sum(1 for o, u in engine.units if o == k and u.is_alive()) for k in (0, 1))
+        assert engine.alive_counts() == expected
+        if 0 in expected:
+            break
+    assert 0 in engine.alive_counts()